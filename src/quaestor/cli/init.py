@@ -1,7 +1,6 @@
 """Initialization commands for Quaestor."""
 
 import importlib.resources as pkg_resources
-import tempfile
 from pathlib import Path
 
 import typer
@@ -17,7 +16,7 @@ from quaestor.constants import (
     TEMPLATE_FILES,
 )
 from quaestor.core.project_metadata import FileManifest, FileType, extract_version_from_content
-from quaestor.core.template_engine import get_project_data, process_template
+from quaestor.core.template_engine import get_project_data, render_template_string
 from quaestor.core.validation_engine import RuleEngine
 from quaestor.updater import QuaestorUpdater, print_update_result
 from quaestor.utils import update_gitignore
@@ -358,13 +357,7 @@ def _init_common(target_dir: Path, force: bool, mode: str):
             # Process template with project data
             try:
                 template_content = pkg_resources.read_text(TEMPLATE_BASE_PATH, template_name)
-                # Create a temporary file to process
-                with tempfile.NamedTemporaryFile(mode="w", suffix=".md", delete=False) as tf:
-                    tf.write(template_content)
-                    temp_path = Path(tf.name)
-
-                ai_content = process_template(temp_path, project_data)
-                temp_path.unlink()  # Clean up temp file
+                ai_content = render_template_string(template_content, project_data)
             except Exception:
                 ai_content = None
 
@@ -6,6 +6,7 @@ to enable smart updates that preserve user customizations.
 
 import hashlib
 import json
+import re
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
@@ -225,8 +226,6 @@ def extract_version_from_content(content: str) -> str | None:
     Returns:
         Version string or None
     """
-    import re
-
     patterns = VERSION_PATTERNS
 
     for pattern in patterns:
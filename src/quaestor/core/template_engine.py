@@ -1,11 +1,88 @@
 """Simplified template processor for rendering markdown templates with project data."""
 
 import re
+from collections.abc import Callable
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
 from quaestor.utils import detect_project_type, get_project_complexity_indicators, load_yaml
 
+# Patterns are compiled once at import time instead of on every render
+# Pattern: any {{ expression }} block, rendered in a single pass over the template.
+# The body runs lazily to the first "}}", so quoted text inside conditionals may contain "}".
+# It must not start with "}", which leaves an empty "{{}}" untouched, and never crosses
+# another "{{", so a stray unclosed "{{" stays in the output instead of eating the text after it
+_TOKEN_RE = re.compile(r"\{\{\s*((?!\{\{)[^}](?:(?!\{\{).)*?)\s*\}\}", re.DOTALL)
+
+# Expressions are matched against the stripped text between the braces
+# Expression: variable_name
+_VARIABLE_RE = re.compile(r"\w+")
+# Expression: "text" if condition else "other"
+_COND_STR_RE = re.compile(r'"([^"]*?)"\s+if\s+(\w+)\s+else\s+"([^"]*?)"')
+# Expression: value if condition else "default"
+_COND_VAL_RE = re.compile(r'(\w+)\s+if\s+(\w+)\s+else\s+"([^"]*?)"')
+# Specific expressions used in templates, dispatched by group name
+_SPECIFIC_RE = re.compile(
+    # Expression: ">=" + coverage_threshold|string + "%" if coverage_threshold else "optional"
+    r'(?P<coverage_ge>">=" \+ coverage_threshold\|string \+ "%"\s+if\s+coverage_threshold\s+else\s+"optional")'
+    # Expression: coverage_threshold|string + "%" if coverage_threshold else "80%"
+    r'|(?P<coverage_pct>coverage_threshold\|string \+ "%"\s+if\s+coverage_threshold\s+else\s+"80%")'
+    # Expression: "true" if project_type == "web" else "false"
+    r'|(?P<is_web>"true"\s+if\s+project_type\s*==\s*"web"\s+else\s+"false")'
+    # Expression: performance_target_ms if performance_target_ms else "200"
+    r'|(?P<performance_target>performance_target_ms\s+if\s+performance_target_ms\s+else\s+"200")'
+)
+
+# Variables containing characters outside alphanumerics, underscore and conditional syntax
+_INVALID_VAR_RE = re.compile(r'\{\{\s*([^}]*[^a-zA-Z0-9_\s|"\'+-]+[^}]*)\s*\}\}')
+# Keywords marking a conditional expression rather than a plain variable
+_CONDITIONAL_KEYWORDS = ("if", "else", "string", "+", '"')
+
+
+def _stringify(value: Any) -> str:
+    """Convert a project data value to its template string form."""
+    if value is None:
+        return ""
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    return str(value)
+
+
+def _is_truthy(value: Any) -> bool:
+    """Evaluate a template condition value, accepting common string spellings of true."""
+    if isinstance(value, str):
+        return value.lower() in ("true", "1", "yes", "on")
+    return bool(value)
+
+
+# Compiled template: renders project data to text
+Renderer = Callable[[dict[str, Any]], str]
+# Compiled template chunk: renders (project data, stringified project data) to text
+_Chunk = Callable[[dict[str, Any], dict[str, str]], str]
+
+# Chunks for the specific patterns used in templates, keyed by _SPECIFIC_RE group name
+_SPECIFIC_CHUNKS: dict[str, _Chunk] = {
+    # Handle coverage threshold patterns
+    "coverage_ge": lambda data, _strings: (
+        f">={data['coverage_threshold']}%" if data.get("coverage_threshold") else "optional"
+    ),
+    "coverage_pct": lambda data, _strings: (
+        f"{data['coverage_threshold']}%" if data.get("coverage_threshold") else "80%"
+    ),
+    # Handle project type specific patterns
+    "is_web": lambda data, _strings: "true" if data.get("project_type", "unknown") == "web" else "false",
+    # Handle performance target patterns
+    "performance_target": lambda data, _strings: str(data.get("performance_target_ms", 200)),
+}
+
+
+@lru_cache(maxsize=1)
+def _load_language_configs() -> dict[str, Any]:
+    """Load the packaged language configuration, parsing the YAML only once per process."""
+    config_path = Path(__file__).parent.parent / "assets" / "configuration" / "languages.yaml"
+    return load_yaml(config_path, {})
+
 
 def get_project_data(project_dir: Path) -> dict[str, Any]:
     """Gather project-specific data for template rendering.
@@ -21,8 +98,7 @@ def get_project_data(project_dir: Path) -> dict[str, Any]:
     complexity_info = get_project_complexity_indicators(project_dir, project_type)
 
     # Load language-specific configuration
-    config_path = Path(__file__).parent.parent / "assets" / "configuration" / "languages.yaml"
-    language_configs = load_yaml(config_path, {})
+    language_configs = _load_language_configs()
 
     # Get config for this project type, fallback to unknown
     lang_config = language_configs.get(project_type, language_configs.get("unknown", {}))
@@ -51,127 +127,114 @@ def process_template(template_path: Path, project_data: dict[str, Any]) -> str:
     Returns:
         Processed template content
     """
-    content = template_path.read_text(encoding="utf-8")
-
-    # Process simple variable substitutions: {{ variable_name }}
-    for key, value in project_data.items():
-        if value is None:
-            value = ""
-        elif isinstance(value, bool):
-            value = "true" if value else "false"
+    stat = template_path.stat()
+    return _compile_template_file(str(template_path), stat.st_mtime_ns, stat.st_size)(project_data)
 
-        # Replace {{ key }} patterns
-        content = re.sub(rf"\{{\{{\s*{re.escape(key)}\s*\}}\}}", str(value), content)
 
-    # Process conditional patterns
-    content = _process_conditionals(content, project_data)
+@lru_cache(maxsize=128)
+def _compile_template_file(template_path: str, mtime_ns: int, size: int) -> Renderer:
+    """Compile a template file, reusing the result until the file changes.
 
-    # Clean up any remaining template variables
-    content = re.sub(r"\{\{\s*[^}]+\s*\}\}", "", content)
+    Args:
+        template_path: Path to template file
+        mtime_ns: Modification time of the file, part of the cache key
+        size: Size of the file, part of the cache key
 
-    return content
+    Returns:
+        Renderer for the template
+    """
+    return _compile_content(Path(template_path).read_text(encoding="utf-8"))
 
 
-def _process_conditionals(content: str, data: dict[str, Any]) -> str:
-    """Process conditional template patterns.
+def _process_content(content: str, project_data: dict[str, Any]) -> str:
+    """Process template content with project data.
 
     Args:
         content: Template content
-        data: Project data
+        project_data: Project-specific data for substitution
 
     Returns:
-        Content with conditionals processed
+        Processed template content
     """
-    # Pattern: {{ "text" if condition else "other" }}
-    conditional_pattern = r'\{\{\s*"([^"]*?)"\s+if\s+(\w+)\s+else\s+"([^"]*?)"\s*\}\}'
+    return _compile_content(content)(project_data)
 
-    def replace_conditional(match):
-        true_text = match.group(1)
-        condition_var = match.group(2)
-        false_text = match.group(3)
 
-        condition_value = data.get(condition_var, False)
-        if isinstance(condition_value, str):
-            condition_value = condition_value.lower() in ("true", "1", "yes", "on")
+def _compile_content(content: str) -> Renderer:
+    """Compile template content into a renderer.
 
-        return true_text if condition_value else false_text
+    The content is tokenized once into literal text and {{ ... }} expressions. Rendering then
+    only concatenates the literals with the output of each compiled expression, after converting
+    the project data values to strings once.
 
-    content = re.sub(conditional_pattern, replace_conditional, content)
+    Args:
+        content: Template content
 
-    # Pattern: {{ value if condition else "default" }}
-    value_conditional_pattern = r'\{\{\s*(\w+)\s+if\s+(\w+)\s+else\s+"([^"]*?)"\s*\}\}'
+    Returns:
+        Renderer for the template
+    """
+    chunks: list[_Chunk] = []
+    literal = ""
+    position = 0
 
-    def replace_value_conditional(match):
-        value_var = match.group(1)
-        condition_var = match.group(2)
-        default_text = match.group(3)
+    for match in _TOKEN_RE.finditer(content):
+        literal += content[position : match.start()]
+        position = match.end()
 
-        condition_value = data.get(condition_var, False)
-        if isinstance(condition_value, str):
-            condition_value = condition_value.lower() in ("true", "1", "yes", "on")
+        chunk = _compile_expression(match.group(1))
+        if chunk is None:
+            # Unknown expressions render as nothing, so merge the surrounding text
+            continue
 
-        return str(data.get(value_var, "")) if condition_value else default_text
+        if literal:
+            chunks.append(lambda _data, _strings, text=literal: text)
+            literal = ""
+        chunks.append(chunk)
 
-    content = re.sub(value_conditional_pattern, replace_value_conditional, content)
+    literal += content[position:]
+    if literal:
+        chunks.append(lambda _data, _strings, text=literal: text)
 
-    # Handle specific patterns used in templates
-    content = _process_specific_patterns(content, data)
+    def render(data: dict[str, Any]) -> str:
+        strings = {key: _stringify(value) for key, value in data.items()}
+        return "".join([chunk(data, strings) for chunk in chunks])
 
-    return content
+    return render
 
 
-def _process_specific_patterns(content: str, data: dict[str, Any]) -> str:
-    """Process specific template patterns found in the codebase.
+def _compile_expression(expression: str) -> _Chunk | None:
+    """Compile a single template expression.
 
     Args:
-        content: Template content
-        data: Project data
+        expression: Text between the template braces, without surrounding whitespace
 
     Returns:
-        Content with specific patterns processed
+        Chunk rendering the expression, or None for unknown expressions
     """
-    # Handle coverage threshold patterns
-    coverage_threshold = data.get("coverage_threshold")
-    if coverage_threshold:
-        # Pattern: {{ ">=" + coverage_threshold|string + "%" if coverage_threshold else "optional" }}
-        content = re.sub(
-            r'\{\{\s*">=" \+ coverage_threshold\|string \+ "%"\s+if\s+coverage_threshold\s+else\s+"optional"\s*\}\}',
-            f">={coverage_threshold}%",
-            content,
+    # Simple variable substitution: {{ variable_name }}
+    if _VARIABLE_RE.fullmatch(expression):
+        return lambda _data, strings: strings.get(expression, "")
+
+    # Conditional: {{ "text" if condition else "other" }}
+    match = _COND_STR_RE.fullmatch(expression)
+    if match:
+        true_text, condition_var, false_text = match.groups()
+        return lambda data, _strings: true_text if _is_truthy(data.get(condition_var, False)) else false_text
+
+    # Conditional: {{ value if condition else "default" }}
+    match = _COND_VAL_RE.fullmatch(expression)
+    if match:
+        value_var, condition_var, default_text = match.groups()
+        return lambda data, _strings: (
+            str(data.get(value_var, "")) if _is_truthy(data.get(condition_var, False)) else default_text
         )
 
-        # Pattern: {{ coverage_threshold|string + "%" if coverage_threshold else "80%" }}
-        content = re.sub(
-            r'\{\{\s*coverage_threshold\|string \+ "%"\s+if\s+coverage_threshold\s+else\s+"80%"\s*\}\}',
-            f"{coverage_threshold}%",
-            content,
-        )
-    else:
-        content = re.sub(
-            r'\{\{\s*">=" \+ coverage_threshold\|string \+ "%"\s+if\s+coverage_threshold\s+else\s+"optional"\s*\}\}',
-            "optional",
-            content,
-        )
-        content = re.sub(
-            r'\{\{\s*coverage_threshold\|string \+ "%"\s+if\s+coverage_threshold\s+else\s+"80%"\s*\}\}', "80%", content
-        )
+    # Specific patterns used in templates
+    match = _SPECIFIC_RE.fullmatch(expression)
+    if match:
+        return _SPECIFIC_CHUNKS[match.lastgroup]
 
-    # Handle project type specific patterns
-    project_type = data.get("project_type", "unknown")
-
-    # Pattern: {{ "true" if project_type == "web" else "false" }}
-    is_web = "true" if project_type == "web" else "false"
-    content = re.sub(r'\{\{\s*"true"\s+if\s+project_type\s*==\s*"web"\s+else\s+"false"\s*\}\}', is_web, content)
-
-    # Handle performance target patterns
-    performance_target = data.get("performance_target_ms", 200)
-    content = re.sub(
-        r'\{\{\s*performance_target_ms\s+if\s+performance_target_ms\s+else\s+"200"\s*\}\}',
-        str(performance_target),
-        content,
-    )
-
-    return content
+    # Clean up any remaining template variables
+    return None
 
 
 def render_template_string(template_str: str, project_data: dict[str, Any]) -> str:
@@ -184,18 +247,7 @@ def render_template_string(template_str: str, project_data: dict[str, Any]) -> s
     Returns:
         Rendered string
     """
-    # Create a temporary file to use existing process_template function
-    import tempfile
-
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".md", delete=False) as tf:
-        tf.write(template_str)
-        temp_path = Path(tf.name)
-
-    try:
-        result = process_template(temp_path, project_data)
-        return result
-    finally:
-        temp_path.unlink()
+    return _process_content(template_str, project_data)
 
 
 def validate_template(template_path: Path) -> tuple[bool, list[str]]:
@@ -228,9 +280,9 @@ def validate_template(template_path: Path) -> tuple[bool, list[str]]:
         errors.append(f"Unmatched template braces: {open_braces} opening, {close_braces} closing")
 
     # Invalid variable names (should be alphanumeric + underscore)
-    invalid_vars = re.findall(r'\{\{\s*([^}]*[^a-zA-Z0-9_\s|"\'+-]+[^}]*)\s*\}\}', content)
-    for var in invalid_vars:
-        if not any(keyword in var for keyword in ["if", "else", "string", "+", '"']):  # Skip conditionals
+    for match in _INVALID_VAR_RE.finditer(content):
+        var = match.group(1)
+        if not any(keyword in var for keyword in _CONDITIONAL_KEYWORDS):  # Skip conditionals
             errors.append(f"Invalid variable name: {var}")
 
     return len(errors) == 0, errors
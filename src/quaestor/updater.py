@@ -5,8 +5,10 @@ customizations while ensuring critical updates are applied.
 """
 
 import importlib.resources as pkg_resources
-import shutil
+import os
+import tarfile
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
@@ -17,7 +19,84 @@ from quaestor import __version__
 from quaestor.constants import COMMAND_FILES, QUAESTOR_CONFIG_END, QUAESTOR_CONFIG_START
 from quaestor.core.project_metadata import FileManifest, FileType, categorize_file, extract_version_from_content
 
-console = Console()
+
+@lru_cache(maxsize=1)
+def _console() -> Console:
+    """Get the shared console, created on first output rather than at import time."""
+    return Console()
+
+
+# Package resources installed into .quaestor, as (resource_path, target_name)
+_QUAESTOR_FILE_SPECS: tuple[tuple[str, str], ...] = (
+    ("QUAESTOR_CLAUDE.md", "QUAESTOR_CLAUDE.md"),
+    ("CRITICAL_RULES.md", "CRITICAL_RULES.md"),
+    ("templates/ARCHITECTURE.template.md", "ARCHITECTURE.md"),
+    ("templates/MEMORY.template.md", "MEMORY.md"),
+)
+
+
+def _read_package_bytes(package: str, resource: str) -> bytes:
+    """Read a resource from the package without decoding it.
+
+    Args:
+        package: Package containing the resource
+        resource: Resource name within the package
+
+    Returns:
+        Raw resource content
+    """
+    return pkg_resources.files(package).joinpath(resource).read_bytes()
+
+
+@lru_cache(maxsize=64)
+def _cached_extract_version(content: bytes) -> str | None:
+    """Extract the version from UTF-8 resource content, reusing results for content seen before.
+
+    The content is only decoded here, the first time it is seen.
+
+    Args:
+        content: Raw file content
+
+    Returns:
+        Version string or None
+    """
+    return extract_version_from_content(content.decode("utf-8"))
+
+
+def _write_file(path: Path, data: bytes):
+    """Write bytes to a file with a single open/write/close sequence.
+
+    Args:
+        path: File to create or truncate
+        data: Content to write
+    """
+    view = memoryview(data)
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+    try:
+        while view:
+            view = view[os.write(fd, view) :]
+    finally:
+        os.close(fd)
+
+
+def _file_matches(path: Path, data: bytes) -> bool:
+    """Check whether a file already holds exactly the given bytes.
+
+    Args:
+        path: File to compare
+        data: Expected content
+
+    Returns:
+        True if the file exists and its content equals data
+    """
+    try:
+        # Sizes differ for most changed files, so this avoids reading them
+        if os.stat(path).st_size != len(data):
+            return False
+        with open(path, "rb") as f:
+            return f.read() == data
+    except OSError:
+        return False
 
 
 class UpdateResult:
@@ -58,6 +137,71 @@ class QuaestorUpdater:
         self.quaestor_dir = target_dir / ".quaestor"
         self.manifest = manifest
         self.claude_commands_dir = Path.home() / ".claude" / "commands"
+        # Quaestor files as (resource_path, target_path, relative_path, file_type)
+        self._quaestor_files: tuple[tuple[str, Path, str, FileType], ...] = tuple(
+            self._describe_quaestor_file(resource_path, target_name)
+            for resource_path, target_name in _QUAESTOR_FILE_SPECS
+        )
+        # Package resources read so far, keyed by (package, resource)
+        self._resource_cache: dict[tuple[str, str], bytes] = {}
+        # Config section of the packaged CLAUDE.md include template, sliced on first use
+        self._claude_config: str | None = None
+        # Directories already created during the current update
+        self._ensured_dirs: set[Path] = set()
+
+    def _describe_quaestor_file(self, resource_path: str, target_name: str) -> tuple[str, Path, str, FileType]:
+        """Resolve target path, relative path and file type for a .quaestor file.
+
+        Args:
+            resource_path: Path to resource in package
+            target_name: File name within .quaestor
+
+        Returns:
+            Tuple of (resource_path, target_path, relative_path, file_type)
+        """
+        target_path = self.quaestor_dir / target_name
+        relative_path = str(target_path.relative_to(self.target_dir))
+        return resource_path, target_path, relative_path, categorize_file(target_path, relative_path)
+
+    def _ensure_dir(self, directory: Path):
+        """Create a directory (and parents) unless it was already ensured during this update.
+
+        Args:
+            directory: Directory to create
+        """
+        if directory not in self._ensured_dirs:
+            directory.mkdir(parents=True, exist_ok=True)
+            self._ensured_dirs.add(directory)
+
+    def _read_resource(self, package: str, resource: str) -> bytes:
+        """Read a resource from the package, caching it for later checks and updates.
+
+        Resources are kept as bytes, since most are written straight to disk.
+
+        Args:
+            package: Package containing the resource
+            resource: Resource name within the package
+
+        Returns:
+            Raw resource content
+        """
+        key = (package, resource)
+        if key not in self._resource_cache:
+            self._resource_cache[key] = _read_package_bytes(package, resource)
+        return self._resource_cache[key]
+
+    def _packaged_claude_config(self) -> str:
+        """Get the Quaestor config section from the packaged CLAUDE.md include template.
+
+        Returns:
+            Config section including its start and end markers
+        """
+        if self._claude_config is None:
+            include_content = self._read_resource("quaestor.templates", "CLAUDE_INCLUDE.md").decode("utf-8")
+            _, start_marker, rest = include_content.partition(QUAESTOR_CONFIG_START)
+            config_body, end_marker, _ = rest.partition(QUAESTOR_CONFIG_END)
+            self._claude_config = start_marker + config_body + end_marker
+        return self._claude_config
 
     def check_for_updates(self, show_diff: bool = True) -> dict[str, Any]:
         """Check what would be updated without making changes.
@@ -90,17 +234,7 @@ class QuaestorUpdater:
 
     def _check_quaestor_files(self, updates: dict[str, Any]):
         """Check .quaestor directory files."""
-        files_to_check = [
-            ("QUAESTOR_CLAUDE.md", self.quaestor_dir / "QUAESTOR_CLAUDE.md"),
-            ("CRITICAL_RULES.md", self.quaestor_dir / "CRITICAL_RULES.md"),
-            ("templates/ARCHITECTURE.template.md", self.quaestor_dir / "ARCHITECTURE.md"),
-            ("templates/MEMORY.template.md", self.quaestor_dir / "MEMORY.md"),
-        ]
-
-        for resource_path, target_path in files_to_check:
-            relative_path = str(target_path.relative_to(self.target_dir))
-            file_type = categorize_file(target_path, relative_path)
-
+        for resource_path, target_path, relative_path, file_type in self._quaestor_files:
             # Check if file exists
             if not target_path.exists():
                 updates["files"]["add"].append((relative_path, file_type.value))
@@ -125,12 +259,25 @@ class QuaestorUpdater:
     def _check_command_files(self, updates: dict[str, Any]):
         """Check command files in ~/.claude/commands."""
         command_files = COMMAND_FILES
+        existing = self._existing_command_files()
 
         for cmd_file in command_files:
-            target_path = self.claude_commands_dir / cmd_file
-            if not target_path.exists():
+            if cmd_file not in existing:
                 updates["files"]["add"].append((f"commands/{cmd_file}", FileType.COMMAND.value))
 
+    def _existing_command_files(self) -> set[str]:
+        """List installed command files with a single directory read.
+
+        Returns:
+            Names of entries in the commands directory, empty if it cannot be listed
+        """
+        try:
+            return set(os.listdir(self.claude_commands_dir))
+        except OSError:
+            # Missing, not a directory or unreadable: treat every command as not installed,
+            # so per-file errors surface in the update result instead of aborting
+            return set()
+
     def _has_new_version(self, resource_path: str) -> bool:
         """Check if a resource has a newer version than installed.
 
@@ -142,9 +289,9 @@ class QuaestorUpdater:
         """
         try:
             # Read from package location
-            content = pkg_resources.read_text("quaestor", resource_path)
+            content = self._read_resource("quaestor", resource_path)
 
-            new_version = extract_version_from_content(content)
+            new_version = _cached_extract_version(content)
             if not new_version:
                 return True  # Assume update needed if no version found
 
@@ -157,6 +304,7 @@ class QuaestorUpdater:
 
     def _display_update_preview(self, updates: dict[str, Any]):
         """Display a preview of what would be updated."""
+        console = _console()
         console.print("\n[bold]Update Preview[/bold]")
         console.print(f"Current version: {updates['current_version'] or 'unknown'}")
         console.print(f"New version: {updates['new_version']}\n")
@@ -201,12 +349,13 @@ class QuaestorUpdater:
             UpdateResult with details of what was done
         """
         result = UpdateResult()
+        self._ensured_dirs.clear()
 
         # Create backup if requested
         if backup and not dry_run:
             backup_dir = self._create_backup()
             if backup_dir:
-                console.print(f"[green]✓ Created backup in {backup_dir}[/green]")
+                _console().print(f"[green]✓ Created backup in {backup_dir}[/green]")
 
         # Update quaestor version in manifest
         if not dry_run:
@@ -226,6 +375,8 @@ class QuaestorUpdater:
     def _create_backup(self) -> Path | None:
         """Create a backup of current installation.
 
+        The backup is a single uncompressed tar archive, written sequentially.
+
         Returns:
             Path to backup directory or None if failed
         """
@@ -235,59 +386,53 @@ class QuaestorUpdater:
         try:
             backup_dir.mkdir(parents=True, exist_ok=True)
 
-            # Backup .quaestor directory
-            if self.quaestor_dir.exists():
-                for item in self.quaestor_dir.iterdir():
-                    if item.name != ".backup":
-                        if item.is_dir():
-                            shutil.copytree(item, backup_dir / item.name)
-                        else:
-                            shutil.copy2(item, backup_dir / item.name)
+            with tarfile.open(backup_dir / "backup.tar", "w") as tar:
+                # Backup .quaestor directory
+                with os.scandir(self.quaestor_dir) as entries:
+                    for entry in entries:
+                        if entry.name != ".backup":
+                            tar.add(entry.path, arcname=entry.name)
 
-            # Backup CLAUDE.md
-            claude_md = self.target_dir / "CLAUDE.md"
-            if claude_md.exists():
-                shutil.copy2(claude_md, backup_dir / "CLAUDE.md")
+                # Backup CLAUDE.md
+                claude_md = self.target_dir / "CLAUDE.md"
+                if claude_md.exists():
+                    tar.add(claude_md, arcname="CLAUDE.md")
 
             return backup_dir
 
         except Exception as e:
-            console.print(f"[red]Failed to create backup: {e}[/red]")
+            _console().print(f"[red]Failed to create backup: {e}[/red]")
             return None
 
     def _update_quaestor_files(self, result: UpdateResult, force: bool, dry_run: bool):
         """Update files in .quaestor directory."""
-        files_to_process = [
-            ("QUAESTOR_CLAUDE.md", self.quaestor_dir / "QUAESTOR_CLAUDE.md"),
-            ("CRITICAL_RULES.md", self.quaestor_dir / "CRITICAL_RULES.md"),
-            ("templates/ARCHITECTURE.template.md", self.quaestor_dir / "ARCHITECTURE.md"),
-            ("templates/MEMORY.template.md", self.quaestor_dir / "MEMORY.md"),
-        ]
-
-        for resource_name, target_path in files_to_process:
-            relative_path = str(target_path.relative_to(self.target_dir))
-            file_type = categorize_file(target_path, relative_path)
-
+        for resource_name, target_path, relative_path, file_type in self._quaestor_files:
             try:
                 # Read new content
                 if resource_name.startswith("templates/"):
-                    new_content = pkg_resources.read_text("quaestor.templates", resource_name.replace("templates/", ""))
+                    new_content = self._read_resource("quaestor.templates", resource_name.replace("templates/", ""))
                 else:
-                    new_content = pkg_resources.read_text("quaestor", resource_name)
+                    new_content = self._read_resource("quaestor", resource_name)
 
                 # Determine if we should update
-                should_update = self._should_update_file(target_path, file_type, force)
+                existed = os.path.lexists(target_path)
+                should_update = self._should_update_file(target_path, file_type, force, existed)
 
                 if should_update:
+                    unchanged = existed and _file_matches(target_path, new_content)
                     if not dry_run:
-                        target_path.parent.mkdir(parents=True, exist_ok=True)
-                        target_path.write_text(new_content)
+                        # Skip rewriting files that already match
+                        if not unchanged:
+                            self._ensure_dir(target_path.parent)
+                            _write_file(target_path, new_content)
 
                         # Update manifest
-                        version = extract_version_from_content(new_content) or "1.0"
+                        version = _cached_extract_version(new_content) or "1.0"
                         self.manifest.track_file(target_path, file_type, version, self.target_dir)
 
-                    if target_path.exists():
+                    if unchanged:
+                        result.skipped.append(relative_path)
+                    elif existed:
                         result.updated.append(relative_path)
                     else:
                         result.added.append(relative_path)
@@ -300,17 +445,18 @@ class QuaestorUpdater:
     def _update_command_files(self, result: UpdateResult, dry_run: bool):
         """Update command files in ~/.claude/commands."""
         command_files = COMMAND_FILES
+        existing = self._existing_command_files()
 
         for cmd_file in command_files:
             target_path = self.claude_commands_dir / cmd_file
 
             try:
                 # Commands are always safe to update/add
-                if not target_path.exists():
+                if cmd_file not in existing:
                     if not dry_run:
-                        content = pkg_resources.read_text("quaestor.commands", cmd_file)
-                        self.claude_commands_dir.mkdir(parents=True, exist_ok=True)
-                        target_path.write_text(content)
+                        content = self._read_resource("quaestor.commands", cmd_file)
+                        self._ensure_dir(self.claude_commands_dir)
+                        _write_file(target_path, content)
                     result.added.append(f"commands/{cmd_file}")
 
             except Exception as e:
@@ -327,31 +473,27 @@ class QuaestorUpdater:
             # Read current content
             current_content = claude_path.read_text()
 
-            # Check if has Quaestor config
-            if QUAESTOR_CONFIG_START not in current_content:
+            # Split around the Quaestor config section
+            head, start_marker, rest = current_content.partition(QUAESTOR_CONFIG_START)
+            if not start_marker:
                 # No config section, skip (user may have removed it intentionally)
                 return
 
-            # Get latest include template
-            import importlib.resources as pkg_resources
-
-            include_content = pkg_resources.read_text("quaestor.templates", "CLAUDE_INCLUDE.md")
+            current_body, end_marker, tail = rest.partition(QUAESTOR_CONFIG_END)
+            if not end_marker:
+                # Unterminated config section, skip rather than overwrite the text after it
+                return
 
-            # Extract config section from template
-            config_start_idx = include_content.find(QUAESTOR_CONFIG_START)
-            config_end_idx = include_content.find(QUAESTOR_CONFIG_END) + len(QUAESTOR_CONFIG_END)
-            new_config = include_content[config_start_idx:config_end_idx]
+            current_config = start_marker + current_body + end_marker
 
-            # Extract current config section
-            current_start = current_content.find(QUAESTOR_CONFIG_START)
-            current_end = current_content.find(QUAESTOR_CONFIG_END) + len(QUAESTOR_CONFIG_END)
-            current_config = current_content[current_start:current_end]
+            # Get latest config section from the include template
+            new_config = self._packaged_claude_config()
 
             # Check if update needed
             if new_config != current_config:
                 if not dry_run:
                     # Replace config section
-                    new_content = current_content[:current_start] + new_config + current_content[current_end:]
+                    new_content = head + new_config + tail
                     claude_path.write_text(new_content)
 
                 result.updated.append("CLAUDE.md (config section)")
@@ -359,13 +501,14 @@ class QuaestorUpdater:
         except Exception as e:
             result.failed.append(("CLAUDE.md", str(e)))
 
-    def _should_update_file(self, target_path: Path, file_type: FileType, force: bool) -> bool:
+    def _should_update_file(self, target_path: Path, file_type: FileType, force: bool, exists: bool) -> bool:
         """Determine if a file should be updated.
 
         Args:
             target_path: Path to target file
             file_type: Type of file
             force: Whether to force update
+            exists: Whether the target file already exists
 
         Returns:
             True if file should be updated
@@ -373,7 +516,7 @@ class QuaestorUpdater:
         if force:
             return True
 
-        if not target_path.exists():
+        if not exists:
             return True
 
         if file_type == FileType.SYSTEM:
@@ -395,6 +538,7 @@ def print_update_result(result: UpdateResult):
     Args:
         result: UpdateResult to display
     """
+    console = _console()
     console.print("\n[bold]Update Summary:[/bold]")
 
     if result.added:
@@ -270,16 +270,16 @@ class TestHooksCopyingInInit:
 class TestTemplateCopying:
     """Test that all templates are properly copied during init."""
 
-    @patch('quaestor.cli.init.process_template')
+    @patch('quaestor.cli.init.render_template_string')
     @patch('importlib.resources.read_text')
     @patch('quaestor.cli.init.console')
-    def test_all_template_files_copied(self, _mock_console, mock_read_text, mock_process_template):
+    def test_all_template_files_copied(self, _mock_console, mock_read_text, mock_render_template_string):
         """Test that all template files from TEMPLATE_FILES are copied."""
         from quaestor.constants import TEMPLATE_FILES
         
         # Mock the template content and processing
         mock_read_text.return_value = "# Mock Template Content"
-        mock_process_template.return_value = "# Processed Mock Content"
+        mock_render_template_string.return_value = "# Processed Mock Content"
 
         with tempfile.TemporaryDirectory() as tmpdir:
             target_dir = Path(tmpdir)
@@ -345,14 +345,14 @@ class TestTemplateCopying:
         for ref in expected_references:
             assert ref in claude_content, f"CLAUDE.md should reference {ref}"
 
-    @patch('quaestor.cli.init.process_template')
+    @patch('quaestor.cli.init.render_template_string')
     @patch('importlib.resources.read_text')
     @patch('quaestor.cli.init.console')
-    def test_template_processing_failure_handling(self, _mock_console, mock_read_text, mock_process_template):
+    def test_template_processing_failure_handling(self, _mock_console, mock_read_text, mock_render_template_string):
         """Test that template processing failures are handled gracefully."""
-        # Mock read_text to succeed but process_template to fail
+        # Mock read_text to succeed but render_template_string to fail
         mock_read_text.return_value = "# Mock Template Content"
-        mock_process_template.side_effect = Exception("Processing failed")
+        mock_render_template_string.side_effect = Exception("Processing failed")
 
         with tempfile.TemporaryDirectory() as tmpdir:
             target_dir = Path(tmpdir)
@@ -364,10 +364,10 @@ class TestTemplateCopying:
             quaestor_dir = target_dir / ".quaestor"
             assert quaestor_dir.exists(), ".quaestor directory should be created even if processing fails"
 
-    @patch('quaestor.cli.init.process_template')
+    @patch('quaestor.cli.init.render_template_string')
     @patch('importlib.resources.read_text')
     @patch('quaestor.cli.init.console')
-    def test_missing_template_file_handling(self, _mock_console, mock_read_text, _mock_process_template):
+    def test_missing_template_file_handling(self, _mock_console, mock_read_text, _mock_render_template_string):
         """Test handling when a template file is missing."""
         # Mock read_text to raise an exception (simulating missing file)
         mock_read_text.side_effect = FileNotFoundError("Template not found")
@@ -0,0 +1,156 @@
+"""Tests for the template engine."""
+
+from unittest.mock import patch
+
+from quaestor.core.template_engine import (
+    _compile_template_file,
+    _load_language_configs,
+    get_project_data,
+    process_template,
+    render_template_string,
+    validate_template,
+)
+from quaestor.utils import detect_project_type, load_yaml
+
+
+class TestProjectData:
+    """Test project data gathering."""
+
+    def test_language_configs_loaded_once(self, temp_dir):
+        """Test that languages.yaml is parsed once and reused across calls."""
+        (temp_dir / "pyproject.toml").write_text("[project]\nname = 'test'")
+        _load_language_configs.cache_clear()
+        detect_project_type.cache_clear()
+
+        with patch("quaestor.core.template_engine.load_yaml", wraps=load_yaml) as mock_load:
+            first = get_project_data(temp_dir)
+            second = get_project_data(temp_dir)
+
+        assert mock_load.call_count == 1
+        assert first["lint_command"] == second["lint_command"]
+        _load_language_configs.cache_clear()
+
+
+class TestVariableSubstitution:
+    """Test simple {{ variable }} substitution."""
+
+    def test_substitutes_known_variables(self):
+        """Test that variables present in project data are substituted."""
+        data = {"project_name": "demo", "project_type": "python"}
+        result = render_template_string("{{ project_name }} / {{project_type}}", data)
+        assert result == "demo / python"
+
+    def test_bool_and_none_values(self):
+        """Test that bools render as lowercase strings and None as empty."""
+        data = {"strict": True, "loose": False, "nothing": None}
+        result = render_template_string("[{{ strict }}|{{ loose }}|{{ nothing }}]", data)
+        assert result == "[true|false|]"
+
+    def test_unknown_variables_are_removed(self):
+        """Test that variables missing from project data render as empty."""
+        assert render_template_string("a{{ missing }}b", {}) == "ab"
+
+    def test_values_are_inserted_literally(self):
+        """Test that backslashes in values are not treated as regex escapes."""
+        result = render_template_string("cmd: {{ command }}", {"command": r"C:\tools\lint.exe"})
+        assert result == r"cmd: C:\tools\lint.exe"
+
+
+class TestValidateTemplate:
+    """Test template validation."""
+
+    def test_valid_template(self, temp_dir):
+        """Test that plain variables and conditionals pass validation."""
+        template = temp_dir / "ok.md"
+        template.write_text('{{ project_name }} {{ "a" if strict_mode else "b" }}')
+        assert validate_template(template) == (True, [])
+
+    def test_invalid_variable_name(self, temp_dir):
+        """Test that variables with invalid characters are reported."""
+        template = temp_dir / "bad.md"
+        template.write_text("{{ project.name }}")
+        is_valid, errors = validate_template(template)
+        assert not is_valid
+        assert errors == ["Invalid variable name: project.name "]
+
+
+class TestProcessTemplate:
+    """Test rendering template files."""
+
+    def test_reuses_compiled_template(self, temp_dir):
+        """Test that an unchanged template file is compiled once and re-rendered."""
+        template = temp_dir / "template.md"
+        template.write_text("Project: {{ project_name }}")
+        _compile_template_file.cache_clear()
+
+        assert process_template(template, {"project_name": "one"}) == "Project: one"
+        assert process_template(template, {"project_name": "two"}) == "Project: two"
+        assert _compile_template_file.cache_info().misses == 1
+
+    def test_recompiles_changed_template(self, temp_dir):
+        """Test that editing a template file invalidates the compiled version."""
+        template = temp_dir / "template.md"
+        template.write_text("Old: {{ project_name }}")
+        assert process_template(template, {"project_name": "demo"}) == "Old: demo"
+
+        template.write_text("Updated: {{ project_name }}")
+        assert process_template(template, {"project_name": "demo"}) == "Updated: demo"
+
+
+class TestConditionals:
+    """Test conditional template expressions."""
+
+    def test_text_conditional(self):
+        """Test choosing between literal texts based on a condition."""
+        template = '{{ "strict" if strict_mode else "relaxed" }}'
+        assert render_template_string(template, {"strict_mode": True}) == "strict"
+        assert render_template_string(template, {"strict_mode": False}) == "relaxed"
+        assert render_template_string(template, {"strict_mode": "yes"}) == "strict"
+
+    def test_value_conditional(self):
+        """Test rendering a variable or a default based on a condition."""
+        template = '{{ lint_command if has_linter else "none" }}'
+        assert render_template_string(template, {"lint_command": "ruff", "has_linter": True}) == "ruff"
+        assert render_template_string(template, {"lint_command": "ruff", "has_linter": "off"}) == "none"
+
+    def test_brace_inside_quoted_text(self):
+        """Test that a single closing brace inside quoted conditional text is allowed."""
+        template = '{{ "a}b" if flag else "c" }}'
+        assert render_template_string(template, {"flag": True}) == "a}b"
+        assert render_template_string(template, {"flag": False}) == "c"
+
+    def test_stray_open_braces_keep_following_text(self):
+        """Test that an unclosed {{ does not swallow text and expressions after it."""
+        template = "Use `{{` for blocks.\nSome text\nProject: {{ project_name }}\n"
+        result = render_template_string(template, {"project_name": "demo"})
+        assert result == "Use `{{` for blocks.\nSome text\nProject: demo\n"
+
+    def test_stray_open_braces_before_closing_brace(self):
+        """Test that a lone } after a stray {{ does not extend the match past it."""
+        template = "a {{ b } c {{ project_name }}"
+        assert render_template_string(template, {"project_name": "demo"}) == "a {{ b } c demo"
+
+    def test_mixed_expressions_in_one_template(self):
+        """Test variables, conditionals and unknown expressions rendered together."""
+        template = '{{ name }}: {{ "on" if flag else "off" }} {{ x.y }}!'
+        assert render_template_string(template, {"name": "demo", "flag": True}) == "demo: on !"
+
+
+class TestSpecificPatterns:
+    """Test the template-specific conditional patterns."""
+
+    COVERAGE = '{{ ">=" + coverage_threshold|string + "%" if coverage_threshold else "optional" }}'
+    IS_WEB = '{{ "true" if project_type == "web" else "false" }}'
+
+    def test_coverage_threshold_set(self):
+        """Test coverage pattern with a configured threshold."""
+        assert render_template_string(self.COVERAGE, {"coverage_threshold": 90}) == ">=90%"
+
+    def test_coverage_threshold_missing(self):
+        """Test coverage pattern falls back when no threshold is configured."""
+        assert render_template_string(self.COVERAGE, {}) == "optional"
+
+    def test_project_type_web(self):
+        """Test project type comparison pattern."""
+        assert render_template_string(self.IS_WEB, {"project_type": "web"}) == "true"
+        assert render_template_string(self.IS_WEB, {"project_type": "python"}) == "false"
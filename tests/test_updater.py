@@ -1,7 +1,10 @@
 """Tests for the Quaestor update functionality."""
 
+import os
+import tarfile
 from unittest.mock import patch
 
+from quaestor.constants import QUAESTOR_CONFIG_END, QUAESTOR_CONFIG_START
 from quaestor.core.project_metadata import FileManifest, FileType
 from quaestor.updater import QuaestorUpdater, UpdateResult
 
@@ -118,6 +121,48 @@ class TestQuaestorUpdater:
         assert updates["current_version"] == "0.2.3"
         assert updates["new_version"] == "0.2.4"
 
+    def test_check_for_updates_missing_commands(self, temp_dir):
+        """Test that only command files missing from the commands directory are listed."""
+        quaestor_dir = temp_dir / ".quaestor"
+        quaestor_dir.mkdir()
+        manifest = FileManifest(quaestor_dir / "manifest.json")
+
+        commands_dir = temp_dir / "commands"
+        commands_dir.mkdir()
+        (commands_dir / "task.md").write_text("Task command")
+
+        updater = QuaestorUpdater(temp_dir, manifest)
+        updater.claude_commands_dir = commands_dir
+        updates = updater.check_for_updates(show_diff=False)
+
+        added = [path for path, _ in updates["files"]["add"]]
+        assert "commands/status.md" in added
+        assert "commands/task.md" not in added
+
+    def test_commands_path_not_a_directory(self, temp_dir):
+        """Test that a commands path that is not a directory does not abort check or update."""
+        quaestor_dir = temp_dir / ".quaestor"
+        quaestor_dir.mkdir()
+        manifest = FileManifest(quaestor_dir / "manifest.json")
+
+        commands_path = temp_dir / "commands"
+        commands_path.write_text("not a directory")
+
+        updater = QuaestorUpdater(temp_dir, manifest)
+        updater.claude_commands_dir = commands_path
+
+        updates = updater.check_for_updates(show_diff=False)
+        assert ("commands/task.md", FileType.COMMAND.value) in updates["files"]["add"]
+
+        with patch("quaestor.updater._read_package_bytes") as mock_read:
+            mock_read.return_value = b"<!-- QUAESTOR:version:1.1 -->\nNew content"
+            dry_result = updater.update(dry_run=True)
+            result = updater.update()
+
+        assert "commands/task.md" in dry_result.added
+        assert "commands/task.md" in [path for path, _ in result.failed]
+        assert commands_path.read_text() == "not a directory"
+
     def test_update_skip_user_modified_files(self, temp_dir):
         """Test that user-modified files are skipped during update."""
         # Setup
@@ -137,8 +182,8 @@ class TestQuaestorUpdater:
         updater = QuaestorUpdater(temp_dir, manifest)
 
         # Mock package resources
-        with patch("quaestor.updater.pkg_resources.read_text") as mock_read:
-            mock_read.return_value = "<!-- QUAESTOR:version:1.1 -->\nNew content"
+        with patch("quaestor.updater._read_package_bytes") as mock_read:
+            mock_read.return_value = b"<!-- QUAESTOR:version:1.1 -->\nNew content"
             result = updater.update()
 
         # User-modified file should be skipped
@@ -159,13 +204,116 @@ class TestQuaestorUpdater:
         updater = QuaestorUpdater(temp_dir, manifest)
 
         # Mock package resources with new content
-        with patch("quaestor.updater.pkg_resources.read_text") as mock_read:
-            mock_read.return_value = "<!-- QUAESTOR:version:1.1 -->\nNew critical rules"
+        with patch("quaestor.updater._read_package_bytes") as mock_read:
+            mock_read.return_value = b"<!-- QUAESTOR:version:1.1 -->\nNew critical rules"
             updater.update()
 
         # System file should be updated
         assert critical_file.read_text() == "<!-- QUAESTOR:version:1.1 -->\nNew critical rules"
 
+    def test_update_adds_missing_files(self, temp_dir):
+        """Test that files missing before the update are reported as added."""
+        quaestor_dir = temp_dir / ".quaestor"
+        quaestor_dir.mkdir()
+        manifest = FileManifest(quaestor_dir / "manifest.json")
+
+        updater = QuaestorUpdater(temp_dir, manifest)
+        updater.claude_commands_dir = temp_dir / "commands"
+
+        with patch("quaestor.updater._read_package_bytes") as mock_read:
+            mock_read.return_value = b"<!-- QUAESTOR:version:1.1 -->\nNew content"
+            result = updater.update()
+
+        assert ".quaestor/CRITICAL_RULES.md" in result.added
+        assert ".quaestor/CRITICAL_RULES.md" not in result.updated
+        assert (quaestor_dir / "CRITICAL_RULES.md").read_text() == "<!-- QUAESTOR:version:1.1 -->\nNew content"
+        assert (temp_dir / "commands" / "task.md").exists()
+
+    def test_update_skips_unchanged_files(self, temp_dir):
+        """Test that files already matching the new content are not rewritten."""
+        quaestor_dir = temp_dir / ".quaestor"
+        quaestor_dir.mkdir()
+        manifest = FileManifest(quaestor_dir / "manifest.json")
+
+        content = b"<!-- QUAESTOR:version:1.1 -->\nSame rules"
+        critical_file = quaestor_dir / "CRITICAL_RULES.md"
+        critical_file.write_bytes(content)
+        os.utime(critical_file, ns=(0, 0))
+
+        updater = QuaestorUpdater(temp_dir, manifest)
+        updater.claude_commands_dir = temp_dir / "commands"
+
+        with patch("quaestor.updater._read_package_bytes") as mock_read:
+            mock_read.return_value = content
+            result = updater.update()
+
+        assert ".quaestor/CRITICAL_RULES.md" in result.skipped
+        assert ".quaestor/CRITICAL_RULES.md" not in result.updated
+        assert critical_file.stat().st_mtime_ns == 0
+        assert manifest.get_file_info(".quaestor/CRITICAL_RULES.md") is not None
+
+    def test_package_resources_read_once(self, temp_dir):
+        """Test that check and update share package resource reads."""
+        quaestor_dir = temp_dir / ".quaestor"
+        quaestor_dir.mkdir()
+        manifest = FileManifest(quaestor_dir / "manifest.json")
+
+        critical_file = quaestor_dir / "CRITICAL_RULES.md"
+        critical_file.write_text("Old content")
+        manifest.track_file(critical_file, FileType.SYSTEM, "1.0", temp_dir)
+
+        updater = QuaestorUpdater(temp_dir, manifest)
+
+        with patch("quaestor.updater._read_package_bytes") as mock_read:
+            mock_read.return_value = b"<!-- QUAESTOR:version:1.1 -->\nNew critical rules"
+            updater.check_for_updates(show_diff=False)
+            updater.update(dry_run=True)
+
+        resources = [call.args for call in mock_read.call_args_list]
+        assert resources.count(("quaestor", "CRITICAL_RULES.md")) == 1
+
+    def test_update_claude_md_config_section(self, temp_dir):
+        """Test that the CLAUDE.md config section is refreshed and the template read once."""
+        quaestor_dir = temp_dir / ".quaestor"
+        quaestor_dir.mkdir()
+        manifest = FileManifest(quaestor_dir / "manifest.json")
+
+        claude_md = temp_dir / "CLAUDE.md"
+        claude_md.write_text(f"# Mine\n{QUAESTOR_CONFIG_START}\nold\n{QUAESTOR_CONFIG_END}\n# Footer\n")
+        include = f"Header\n{QUAESTOR_CONFIG_START}\nnew\n{QUAESTOR_CONFIG_END}\n".encode()
+
+        updater = QuaestorUpdater(temp_dir, manifest)
+        with patch("quaestor.updater._read_package_bytes", return_value=include) as mock_read:
+            first = UpdateResult()
+            updater._update_claude_md_include(first, dry_run=False)
+            second = UpdateResult()
+            updater._update_claude_md_include(second, dry_run=False)
+
+        assert first.updated == ["CLAUDE.md (config section)"]
+        assert second.updated == []
+        assert mock_read.call_count == 1
+        assert claude_md.read_text() == f"# Mine\n{QUAESTOR_CONFIG_START}\nnew\n{QUAESTOR_CONFIG_END}\n# Footer\n"
+
+    def test_update_claude_md_missing_end_marker(self, temp_dir):
+        """Test that a config section without an end marker leaves CLAUDE.md untouched."""
+        quaestor_dir = temp_dir / ".quaestor"
+        quaestor_dir.mkdir()
+        manifest = FileManifest(quaestor_dir / "manifest.json")
+
+        original = f"# Mine\n{QUAESTOR_CONFIG_START}\nold config\n\n## My own notes\nIMPORTANT USER TEXT\n"
+        claude_md = temp_dir / "CLAUDE.md"
+        claude_md.write_text(original)
+        include = f"Header\n{QUAESTOR_CONFIG_START}\nnew\n{QUAESTOR_CONFIG_END}\n".encode()
+
+        updater = QuaestorUpdater(temp_dir, manifest)
+        result = UpdateResult()
+        with patch("quaestor.updater._read_package_bytes", return_value=include):
+            updater._update_claude_md_include(result, dry_run=False)
+
+        assert result.updated == []
+        assert result.failed == []
+        assert claude_md.read_text() == original
+
     def test_update_with_backup(self, temp_dir):
         """Test creating a backup during update."""
         # Setup
@@ -187,6 +335,26 @@ class TestQuaestorUpdater:
 
         mock_backup.assert_called_once()
 
+    def test_create_backup_archives_files(self, temp_dir):
+        """Test that a backup archives .quaestor contents and CLAUDE.md."""
+        quaestor_dir = temp_dir / ".quaestor"
+        (quaestor_dir / "templates").mkdir(parents=True)
+        (quaestor_dir / "MEMORY.md").write_text("Memory")
+        (quaestor_dir / "templates" / "nested.md").write_text("Nested")
+        (temp_dir / "CLAUDE.md").write_text("Claude")
+        manifest = FileManifest(quaestor_dir / "manifest.json")
+
+        updater = QuaestorUpdater(temp_dir, manifest)
+        backup_dir = updater._create_backup()
+
+        assert backup_dir is not None
+        with tarfile.open(backup_dir / "backup.tar") as tar:
+            names = tar.getnames()
+            assert tar.extractfile("MEMORY.md").read() == b"Memory"
+            assert tar.extractfile("templates/nested.md").read() == b"Nested"
+            assert tar.extractfile("CLAUDE.md").read() == b"Claude"
+        assert not any(name.startswith(".backup") for name in names)
+
     def test_update_result_summary(self):
         """Test UpdateResult summary generation."""
         result = UpdateResult()
@@ -235,21 +403,21 @@ class TestUpdateIntegration:
         updater = QuaestorUpdater(temp_dir, manifest2)
 
         # Mock new versions of files
-        with patch("quaestor.updater.pkg_resources.read_text") as mock_read:
-            # Need to handle multiple calls to read_text for different files
-            def read_text_side_effect(package, resource):
+        with patch("quaestor.updater._read_package_bytes") as mock_read:
+            # Need to handle multiple calls to _read_package_bytes for different files
+            def read_bytes_side_effect(package, resource):
                 if resource == "QUAESTOR_CLAUDE.md":
-                    return "<!-- QUAESTOR:version:1.1 -->\nUpdated QUAESTOR_CLAUDE content"
+                    return b"<!-- QUAESTOR:version:1.1 -->\nUpdated QUAESTOR_CLAUDE content"
                 elif resource == "CRITICAL_RULES.md":
-                    return "<!-- QUAESTOR:version:1.1 -->\nUpdated CRITICAL_RULES content"
+                    return b"<!-- QUAESTOR:version:1.1 -->\nUpdated CRITICAL_RULES content"
                 elif resource == "ARCHITECTURE.template.md":
-                    return "<!-- QUAESTOR:version:1.1 -->\nUpdated architecture"
+                    return b"<!-- QUAESTOR:version:1.1 -->\nUpdated architecture"
                 elif resource == "MEMORY.template.md":
-                    return "<!-- QUAESTOR:version:1.1 -->\nUpdated memory"
+                    return b"<!-- QUAESTOR:version:1.1 -->\nUpdated memory"
                 else:
                     raise FileNotFoundError(f"Resource {resource} not found")
 
-            mock_read.side_effect = read_text_side_effect
+            mock_read.side_effect = read_bytes_side_effect
 
             with patch("quaestor.updater.__version__", "0.2.4"):
                 result = updater.update()